@@ -2,11 +2,19 @@
 Custom fields for models.
 """
 
+import functools
+
 from django.core import checks
-from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 
 
+@functools.cache
+def _field_names(model):
+    """Return the cached set of field names declared on a model."""
+
+    return frozenset(field.name for field in model._meta.get_fields())
+
+
 class OrderField(models.PositiveIntegerField):
 
     description = 'Ordering field with unique value for a particular field.'
@@ -32,9 +40,7 @@ class OrderField(models.PositiveIntegerField):
                 checks.Error('OrderField must define a "unique_to" attribute.')
             ]
 
-        fields = {field.name for field in self.model._meta.get_fields()}
-
-        if self.unique_to not in fields:
+        if self.unique_to not in _field_names(self.model):
             return [
                 checks.Error(
                     'Field name passed with "unique_to" attribute does not '
@@ -44,6 +50,43 @@ class OrderField(models.PositiveIntegerField):
 
         return []
 
+    def assign_many(self, instances):
+        """
+        Assign order numbers to unsaved instances with a single grouped
+        query instead of one aggregate per row in `pre_save`.
+        """
+
+        unique_to_attname = self.model._meta.get_field(self.unique_to).attname
+
+        pending = [
+            obj for obj in instances
+            if getattr(obj, self.attname) is None
+        ]
+        if not pending:
+            return
+
+        keys = {getattr(obj, unique_to_attname) for obj in pending}
+        rows = self.model.objects.filter(
+            **{f'{self.unique_to}__in': keys}
+        ).values(unique_to_attname).annotate(m=models.Max(self.attname))
+
+        last_values = {row[unique_to_attname]: row['m'] or 0 for row in rows}
+
+        # Explicit orderings carried by other instances of the same batch
+        # must seed the counters too, or the auto-assigned numbers would
+        # collide with them on insert.
+        for obj in instances:
+            explicit = getattr(obj, self.attname)
+            key = getattr(obj, unique_to_attname)
+
+            if explicit is not None and explicit > last_values.get(key, 0):
+                last_values[key] = explicit
+
+        for obj in pending:
+            key = getattr(obj, unique_to_attname)
+            last_values[key] = last_values.get(key, 0) + 1
+            setattr(obj, self.attname, last_values[key])
+
     def pre_save(self, model_instance, add):
         """
         Adding order number automatically if not passed.
@@ -51,16 +94,11 @@ class OrderField(models.PositiveIntegerField):
 
         if getattr(model_instance, self.attname) is None:
 
-            qs = self.model.objects.all()
-
-            try:
-                query = {self.unique_to: getattr(model_instance, self.unique_to)}
-                qs.filter(**query)
-                last_item = qs.latest(self.attname)
-                value = getattr(last_item, self.attname) + 1
-            except ObjectDoesNotExist:
-                value = 1
+            query = {self.unique_to: getattr(model_instance, self.unique_to)}
+            current_max = self.model.objects.filter(**query).aggregate(
+                m=models.Max(self.attname)
+            )['m']
 
-            setattr(model_instance, self.attname, value)
+            setattr(model_instance, self.attname, (current_max or 0) + 1)
 
         return super().pre_save(model_instance, add)
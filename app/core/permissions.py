@@ -11,4 +11,4 @@ class AccessOwnerOnly(BasePermission):
     def has_object_permission(self, request, view, obj):
         """Check if the request is made by the owner."""
 
-        return obj.user.id == request.user.id
+        return obj.user_id == request.user.id
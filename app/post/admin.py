@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 
 from post.models import Category, Author, Post, Section, Tag, Comment
 
@@ -7,37 +8,111 @@ from post.models import Category, Author, Post, Section, Tag, Comment
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'slug', 'ordering']
     list_display_links = ['name', 'slug']
+    list_select_related = ['user']
+    list_per_page = 50
+    show_full_result_count = False
     prepopulated_fields = {'slug': ['name']}
+    search_fields = ['name']
 
 
 @admin.register(Author)
 class AuthorAdmin(admin.ModelAdmin):
     list_display = ['name', 'slug']
     list_display_links = ['name', 'slug']
+    list_select_related = ['user']
+    list_per_page = 50
+    show_full_result_count = False
     prepopulated_fields = {'slug': ['name']}
+    search_fields = ['name']
 
 
 class SectionInline(admin.TabularInline):
     model = Section
     fields = ['ordering', 'sub_title', 'content', 'user', 'post']
-    extra = 1
+    autocomplete_fields = ['user', 'post']
+
+    def get_extra(self, request, obj=None, **kwargs):
+        """Only offer a blank section form while the post is unsaved."""
+
+        return 0 if obj else 1
+
+    def get_queryset(self, request):
+        """Join the related user and post and project the inline columns."""
+
+        return super().get_queryset(request).select_related(
+            'user', 'post'
+        ).only(
+            'ordering', 'sub_title', 'content',
+            'user__email', 'post__title'
+        ).order_by('ordering', 'pk')
 
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ['user', 'post', 'name', 'message', 'date_created',
                     'date_updated', 'is_visible']
+    list_select_related = ['user', 'post']
+    list_per_page = 50
+    show_full_result_count = False
+    date_hierarchy = 'date_created'
+    ordering = ['-date_created']
+    autocomplete_fields = ['user', 'post']
     readonly_fields = ['date_created', 'date_updated']
 
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ['title', 'category', 'author', 'created_at', 'updated_at']
+    list_display = ['title', 'category', 'author', 'comment_count',
+                    'section_count', 'created_at', 'updated_at']
+    list_select_related = ['category', 'author']
+    list_per_page = 50
+    show_full_result_count = False
+    date_hierarchy = 'created_at'
+    ordering = ['-created_at']
     prepopulated_fields = {'slug': ['title']}
+    search_fields = ['title']
+    autocomplete_fields = ['category', 'author', 'user']
     readonly_fields = ['created_at', 'updated_at']
     inlines = [SectionInline]
 
+    def get_queryset(self, request):
+        """Skip the heavy text and image columns in the changelist and
+        pre-aggregate the related counts."""
+
+        return super().get_queryset(request).defer(
+            'excerpt', 'image'
+        ).annotate(
+            _comment_count=Count('comments', distinct=True),
+            _section_count=Count('sections', distinct=True)
+        )
+
+    @admin.display(ordering='_comment_count', description='comments')
+    def comment_count(self, obj):
+        """Return the pre-aggregated number of comments."""
+
+        return obj._comment_count
+
+    @admin.display(ordering='_section_count', description='sections')
+    def section_count(self, obj):
+        """Return the pre-aggregated number of sections."""
+
+        return obj._section_count
+
+    def save_formset(self, request, form, formset, change):
+        """Bulk-assign section order numbers before the formset saves."""
+
+        if formset.model is Section:
+            new_sections = [
+                f.instance for f in formset.extra_forms if f.has_changed()
+            ]
+            Section._meta.get_field('ordering').assign_many(new_sections)
+
+        super().save_formset(request, form, formset, change)
+
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
     list_display = ['name', 'user']
+    list_select_related = ['user']
+    list_per_page = 50
+    show_full_result_count = False
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class PostConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'post'
+
+    def ready(self):
+        """Wire up cache invalidation for the lookup-table caches."""
+
+        from post.cache import connect_invalidation_signals
+
+        connect_invalidation_signals()
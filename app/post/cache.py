@@ -0,0 +1,40 @@
+"""
+In-process caches for hot read-mostly lookup tables.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.shortcuts import get_object_or_404
+
+from post.models import Post
+
+POST_SLUG_TIMEOUT = 60 * 60
+
+
+def get_post_pk_by_slug(slug):
+    """Resolve a post slug to its pk without hydrating the whole row."""
+
+    key = f'post_slug_pk:{slug}'
+    pk = cache.get(key)
+
+    if pk is None:
+        pk = get_object_or_404(
+            Post.objects.values_list('pk', flat=True),
+            slug=slug
+        )
+        cache.set(key, pk, POST_SLUG_TIMEOUT)
+
+    return pk
+
+
+def _clear_post_slug_cache(sender, instance, **kwargs):
+    slugs = {instance.slug, getattr(instance, '_orig_slug', None)}
+
+    cache.delete_many([f'post_slug_pk:{slug}' for slug in slugs if slug])
+
+
+def connect_invalidation_signals():
+    """Drop stale cache entries whenever a cached model changes."""
+
+    post_save.connect(_clear_post_slug_cache, sender=Post)
+    post_delete.connect(_clear_post_slug_cache, sender=Post)
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-09-01 10:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='author',
+            constraint=models.UniqueConstraint(fields=('user', 'slug'), name='uniq_author_user_slug'),
+        ),
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(fields=('user', 'slug'), name='uniq_category_user_slug'),
+        ),
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(fields=('user', 'ordering'), name='uniq_category_user_ordering'),
+        ),
+        migrations.AddConstraint(
+            model_name='post',
+            constraint=models.UniqueConstraint(fields=('user', 'slug'), name='uniq_post_user_slug'),
+        ),
+        migrations.AddConstraint(
+            model_name='section',
+            constraint=models.UniqueConstraint(fields=('post', 'ordering'), name='uniq_section_post_ordering'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-09-01 10:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0002_author_uniq_author_user_slug_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', '-date_created'], name='post_commen_post_id_2f42de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['user', '-created_at'], name='post_post_user_id_7a756f_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-09-01 11:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0003_comment_post_commen_post_id_2f42de_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['user', 'name'], name='post_tag_user_id_31081a_idx'),
+        ),
+    ]
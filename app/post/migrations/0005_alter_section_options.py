@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-09-01 11:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0004_tag_post_tag_user_id_31081a_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='section',
+            options={},
+        ),
+    ]
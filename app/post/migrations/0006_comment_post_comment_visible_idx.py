@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-09-01 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0005_alter_section_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['post'], name='post_comment_visible_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-09-01 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0006_comment_post_comment_visible_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['user', 'author'], name='post_post_user_id_bb9d30_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['user', 'category'], name='post_post_user_id_5cf26a_idx'),
+        ),
+    ]
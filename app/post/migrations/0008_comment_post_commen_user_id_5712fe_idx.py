@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-09-01 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0007_post_post_post_user_id_bb9d30_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['user', 'post', 'is_visible'], name='post_commen_user_id_5712fe_idx'),
+        ),
+    ]
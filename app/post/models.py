@@ -3,19 +3,31 @@ from django.conf import settings
 from django.utils.text import slugify
 
 from core.fields import OrderField
-from post.checks import FieldsValidator
 
-import os
+from functools import cached_property, lru_cache
+
 import uuid
 
 
+VISIBLE_COMMENTS_LIMIT = 50
+
+
+@lru_cache(maxsize=2048)
+def _cached_slugify(value):
+    """Memoized slugify; the transform is pure, so caching is safe."""
+
+    return slugify(value)
+
+
 def post_image_file_path(instance, filename):
     """Generate file path for a new post image."""
 
-    ext = os.path.splitext(filename)[1]
-    filename = f'{uuid.uuid4()}{ext}'
+    name = uuid.uuid4().hex
 
-    return os.path.join('uploads', 'images', filename)
+    if '.' in filename:
+        return f'uploads/images/{name}.{filename.rsplit(".", 1)[1]}'
+
+    return f'uploads/images/{name}'
 
 
 class Category(models.Model):
@@ -33,22 +45,42 @@ class Category(models.Model):
     class Meta:
         verbose_name = 'category'
         verbose_name_plural = 'categories'
-
-    def clean(self):
-        """Check if slug and ordering number is unique for related user."""
-
-        validator = FieldsValidator()
-        validator.check_slug(self)
-        validator.check_ordering(self)
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'slug'],
+                name='uniq_category_user_slug'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'ordering'],
+                name='uniq_category_user_ordering'
+            ),
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._orig_slug = self.__dict__.get('slug')
+        self._orig_ordering = self.__dict__.get('ordering')
+        self._orig_user_id = self.__dict__.get('user_id')
 
     def save(self, *args, **kwargs):
         """Auto field creation and validation before saving."""
 
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = _cached_slugify(self.name)
+
+        if (self._state.adding
+                or self.slug != self._orig_slug
+                or self.ordering != self._orig_ordering
+                or self.user_id != self._orig_user_id):
+            self.full_clean()
+
+        saved = super(Category, self).save(*args, **kwargs)
+
+        self._orig_slug = self.slug
+        self._orig_ordering = self.ordering
+        self._orig_user_id = self.user_id
 
-        self.full_clean()
-        return super(Category, self).save(*args, **kwargs)
+        return saved
 
     def __str__(self):
         """Return a string representation of the object."""
@@ -68,20 +100,36 @@ class Author(models.Model):
     slug = models.SlugField(max_length=255, null=True, blank=True)
     description = models.TextField(max_length=2000, null=True, blank=True)
 
-    def clean(self):
-        """Check if slug is unique for related user."""
-
-        validator = FieldsValidator()
-        validator.check_slug(self)
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'slug'],
+                name='uniq_author_user_slug'
+            ),
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._orig_slug = self.__dict__.get('slug')
+        self._orig_user_id = self.__dict__.get('user_id')
 
     def save(self, *args, **kwargs):
         """Auto field creation and validation before saving."""
 
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = _cached_slugify(self.name)
+
+        if (self._state.adding
+                or self.slug != self._orig_slug
+                or self.user_id != self._orig_user_id):
+            self.full_clean()
+
+        saved = super(Author, self).save(*args, **kwargs)
 
-        self.full_clean()
-        return super(Author, self).save(*args, **kwargs)
+        self._orig_slug = self.slug
+        self._orig_user_id = self.user_id
+
+        return saved
 
     def __str__(self):
         """Return a string representation of the object."""
@@ -124,20 +172,87 @@ class Post(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     tags = models.ManyToManyField('Tag', related_name='posts', blank=True)
 
-    def clean(self):
-        """Check if slug is unique for related user."""
-
-        validator = FieldsValidator()
-        validator.check_slug(self)
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'slug'],
+                name='uniq_post_user_slug'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'author']),
+            models.Index(fields=['user', 'category']),
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._orig_slug = self.__dict__.get('slug')
+        self._orig_user_id = self.__dict__.get('user_id')
+
+    @classmethod
+    def prepare_bulk(cls, instances, batch_size=500):
+        """
+        Slugify and insert many posts with a single bulk INSERT, skipping
+        per-row save()/full_clean(); the unique constraints still enforce
+        the invariants at the database level.
+        """
+
+        for post in instances:
+            if not post.slug:
+                post.slug = _cached_slugify(post.title)
+
+        return cls.objects.bulk_create(instances, batch_size=batch_size)
+
+    @property
+    def ordered_sections(self):
+        """
+        Sections of the post sorted by their order number. Serving the
+        serializer from this property instead of the bare related manager
+        keeps responses ordered even right after a create or update, when
+        no prefetch cache exists; detail GETs reuse the ordered prefetch.
+        """
+
+        cache = getattr(self, '_prefetched_objects_cache', None)
+
+        if cache is not None and 'sections' in cache:
+            return cache['sections']
+
+        return self.sections.order_by('ordering', 'pk')
+
+    @cached_property
+    def visible_comments(self):
+        """
+        Moderated comments of the post, capped to a fixed window; the
+        comments endpoint serves the full, paginated stream. List-type
+        views preload this attribute through a Prefetch, which shadows
+        the property.
+        """
+
+        return list(
+            self.comments.filter(
+                user_id=self.user_id,
+                is_visible=True
+            ).order_by('id')[:VISIBLE_COMMENTS_LIMIT]
+        )
 
     def save(self, *args, **kwargs):
         """Auto field creation and validation before saving."""
 
         if not self.slug:
-            self.slug = slugify(self.title)
+            self.slug = _cached_slugify(self.title)
+
+        if (self._state.adding
+                or self.slug != self._orig_slug
+                or self.user_id != self._orig_user_id):
+            self.full_clean()
 
-        self.full_clean()
-        return super(Post, self).save(*args, **kwargs)
+        saved = super(Post, self).save(*args, **kwargs)
+
+        self._orig_slug = self.slug
+        self._orig_user_id = self.user_id
+
+        return saved
 
     def __str__(self):
         """Return a string representation of the object."""
@@ -163,26 +278,37 @@ class Section(models.Model):
     content = models.TextField()
 
     class Meta:
-        ordering = ['ordering', 'pk']
-
-    def clean(self):
-        """Check if ordering number is unique for the particula post."""
-
-        validator = FieldsValidator()
-        validator.check_ordering(self)
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'ordering'],
+                name='uniq_section_post_ordering'
+            ),
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._orig_ordering = self.__dict__.get('ordering')
+        self._orig_post_id = self.__dict__.get('post_id')
 
     def save(self, *args, **kwargs):
         """Auto field creation and validation before saving."""
 
-        self.full_clean()
-        return super(Section, self).save(*args, **kwargs)
+        if (self._state.adding
+                or self.ordering != self._orig_ordering
+                or self.post_id != self._orig_post_id):
+            self.full_clean()
+
+        saved = super(Section, self).save(*args, **kwargs)
+
+        self._orig_ordering = self.ordering
+        self._orig_post_id = self.post_id
+
+        return saved
 
     def __str__(self):
         """Return a string representation of the object."""
 
-        sub_title = self.sub_title if self.sub_title else ''
-
-        return f'{self.ordering}. {sub_title}'
+        return f'{self.ordering}. {self.sub_title or ""}'
 
 
 class Tag(models.Model):
@@ -195,6 +321,11 @@ class Tag(models.Model):
     )
     name = models.CharField(max_length=100)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name']),
+        ]
+
     def __str__(self):
         """Return a string representation of the object."""
 
@@ -220,6 +351,17 @@ class Comment(models.Model):
     date_created = models.DateTimeField(auto_now_add=True)
     date_updated = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['post', '-date_created']),
+            models.Index(fields=['user', 'post', 'is_visible']),
+            models.Index(
+                fields=['post'],
+                condition=models.Q(is_visible=True),
+                name='post_comment_visible_idx',
+            ),
+        ]
+
     def __str__(self):
         """Return a string representation of the object."""
 
@@ -1,11 +1,36 @@
 """
 Serializers for Category, Author, Post, Tag objects.
 """
+import copy
 
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 from post.models import Category, Author, Post, Section, Tag, Comment
-from drf_spectacular.utils import extend_schema_field
+from post.cache import get_post_pk_by_slug
+
+SECTION_ORDER_FIELD = Section._meta.get_field('ordering')
+
+
+class CachedFieldsMixin:
+    """
+    Memoize ModelSerializer.get_fields per serializer class.
+
+    DRF rebuilds the field map (model introspection plus a deepcopy of
+    every declared field) for each serializer instance; list endpoints
+    instantiate serializers per request, so cache the built map once and
+    hand out shallow copies for binding.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        cached = self._fields_cache.get(cls)
+
+        if cached is None:
+            cached = self._fields_cache[cls] = super().get_fields()
+
+        return {name: copy.copy(field) for name, field in cached.items()}
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -13,7 +38,7 @@ class CategorySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Category
-        fields = ['name', 'slug', 'ordering']
+        fields = ('name', 'slug', 'ordering')
 
 
 class AuthorSerializer(serializers.ModelSerializer):
@@ -21,95 +46,100 @@ class AuthorSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Author
-        fields = ['name', 'slug']
+        fields = ('name', 'slug')
 
 
 class AuthorDetailSerializer(AuthorSerializer):
     """Serializer for Author object in detail pages."""
 
     class Meta(AuthorSerializer.Meta):
-        fields = ['name', 'slug', 'description']
+        fields = ('name', 'slug', 'description')
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Tag object."""
 
     class Meta:
         model = Tag
-        fields = ['id', 'name']
-        read_only_fields = ['id']
+        fields = ('id', 'name')
+        read_only_fields = ('id',)
 
 
-class SectionSerializer(serializers.ModelSerializer):
+class SectionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Section object."""
 
-    class Meta(AuthorSerializer.Meta):
+    class Meta:
         model = Section
-        fields = ['ordering', 'sub_title', 'content']
+        fields = ('ordering', 'sub_title', 'content')
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Comment object."""
 
     post_slug = serializers.CharField(source='post.slug', required=True)
 
     class Meta:
         model = Comment
-        fields = ['id', 'post_slug', 'name', 'message', 'is_visible']
-        read_only_fields = ['id']
+        fields = ('id', 'post_slug', 'name', 'message', 'is_visible')
+        read_only_fields = ('id',)
 
     def create(self, validated_data):
         """Create a comment."""
 
         post_slug = validated_data.pop('post', None)['slug']
 
-        post = get_object_or_404(Post, slug=post_slug)
-
-        return Comment.objects.create(post=post, **validated_data)
+        return Comment.objects.create(
+            post_id=get_post_pk_by_slug(post_slug),
+            **validated_data
+        )
 
     def update(self, instance, validated_data):
         """Update a comment."""
 
         post_slug = validated_data.pop('post', None)
 
+        changed = list(validated_data)
+
         if post_slug is not None:
-            post_slug = post_slug['slug']
-            post = get_object_or_404(Post, slug=post_slug)
-            instance.post = post
+            instance.post_id = get_post_pk_by_slug(post_slug['slug'])
+            changed.append('post')
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
 
-        instance.save()
+        instance.save(update_fields=changed + ['date_updated'])
 
         return instance
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Post object."""
 
     category = CategorySerializer(required=False)
     author = AuthorSerializer(required=False)
-    sections = SectionSerializer(many=True, required=False)
-    comments = serializers.SerializerMethodField('get_visible_comments',
-                                                 required=False)
+    sections = SectionSerializer(source='ordered_sections',
+                                 many=True,
+                                 required=False)
+    comments = CommentSerializer(source='visible_comments',
+                                 many=True,
+                                 read_only=True)
     tags = TagSerializer(many=True, required=False)
 
     class Meta:
         model = Post
-        fields = ['title', 'slug', 'excerpt', 'image', 'time_read',
+        fields = ('title', 'slug', 'excerpt', 'image', 'time_read',
                   'created_at', 'updated_at', 'category', 'author', 'sections',
-                  'comments', 'tags']
+                  'comments', 'tags')
 
     def create(self, validated_data):
         """Create a post."""
 
         category_data = validated_data.pop('category', None)
         author_data = validated_data.pop('author', None)
-        sections = validated_data.pop('sections', [])
+        sections = validated_data.pop('ordered_sections', [])
         tags = validated_data.pop('tags', [])
 
-        post = Post.objects.create(**validated_data)
+        post = Post(**validated_data)
 
         self._assign_parameters(post, category_data, author_data,
                                 sections, tags)
@@ -120,105 +150,141 @@ class PostSerializer(serializers.ModelSerializer):
 
         category_data = validated_data.pop('category', None)
         author_data = validated_data.pop('author', None)
-        sections = validated_data.pop('sections', [])
+        sections = validated_data.pop('ordered_sections', [])
         tags = validated_data.pop('tags', [])
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
 
+        update_fields = list(validated_data) + ['slug', 'updated_at']
+
         self._assign_parameters(instance, category_data, author_data,
-                                sections, tags)
+                                sections, tags, update_fields=update_fields)
         return instance
 
-    @extend_schema_field(CommentSerializer(many=True))
-    def get_visible_comments(self, post):
-        """Return only moderated comments."""
-
-        qs = Comment.objects.filter(
-            user=self.context['request'].user,
-            post=post,
-            is_visible=True
-        )
-
-        return CommentSerializer(qs, many=True).data
-
     def _assign_parameters(self,
                            post: Post,
                            category_data: dict,
                            author_data: dict,
                            sections: list[dict],
-                           tags: list[dict]) -> None:
+                           tags: list[dict],
+                           update_fields: list = None) -> None:
         """Assign parameters to the post"""
 
+        auth_user = self.context['request'].user
+
         if category_data:
-            post.category = self._get_category(category_data)
+            post.category = self._get_category(category_data, auth_user)
+            if update_fields is not None:
+                update_fields.append('category')
 
         if author_data:
-            post.author = self._get_author(author_data)
+            post.author = self._get_author(author_data, auth_user)
+            if update_fields is not None:
+                update_fields.append('author')
+
+        if update_fields is None:
+            post.save()
+        else:
+            post.save(update_fields=update_fields)
 
         if sections:
-            self._create_post_sections(sections, post)
+            self._create_post_sections(sections, post, auth_user)
 
         if tags:
-            self._assign_tags(tags, post)
-
-        post.save()
+            self._assign_tags(tags, post, auth_user)
 
-    def _assign_tags(self, tags: list[dict], post: Post) -> None:
+    def _assign_tags(self, tags: list[dict], post: Post, auth_user) -> None:
         """Get or create tags and assign them to the post."""
 
-        auth_user = self.context['request'].user
-
-        if post.tags:
-            post.tags.clear()
-
-        for tag_data in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user=auth_user,
-                **tag_data
-            )
-            post.tags.add(tag_obj)
-
-        post.save()
+        post.tags.clear()
+
+        names = list(dict.fromkeys(
+            tag_data['name'] for tag_data in tags
+        ))
+        existing = {
+            tag.name: tag
+            for tag in Tag.objects.filter(user=auth_user, name__in=names)
+        }
+        missing = [
+            Tag(user=auth_user, name=name)
+            for name in names if name not in existing
+        ]
+        if missing:
+            Tag.objects.bulk_create(missing)
+
+        through = Post.tags.through
+        through.objects.bulk_create(
+            [
+                through(post=post, tag=tag)
+                for tag in (*existing.values(), *missing)
+            ],
+            ignore_conflicts=True
+        )
 
-    def _get_category(self, category_data: dict) -> Category:
+    def _get_category(self, category_data: dict, auth_user) -> Category:
         """Get and return a category from the database."""
 
-        auth_user = self.context['request'].user
-
-        return get_object_or_404(Category, user=auth_user, **category_data)
+        return get_object_or_404(
+            Category.objects.only('id', 'name', 'slug', 'ordering'),
+            user=auth_user,
+            **category_data
+        )
 
-    def _get_author(self, author_data: dict) -> Author:
+    def _get_author(self, author_data: dict, auth_user) -> Author:
         """Get and return an author from the database."""
 
-        auth_user = self.context['request'].user
-
-        return get_object_or_404(Author, user=auth_user, **author_data)
+        return get_object_or_404(
+            Author.objects.only('id', 'name', 'slug'),
+            user=auth_user,
+            **author_data
+        )
 
-    def _create_post_sections(self, sections: list[dict], post: Post) -> None:
+    def _create_post_sections(self,
+                              sections: list[dict],
+                              post: Post,
+                              auth_user) -> None:
         """Create sections for a particular post"""
 
-        auth_user = self.context['request'].user
-
-        old_sections = post.sections.all()
-        if old_sections.exists():
-            for section in old_sections:
-                section.delete()
+        post.sections.all().delete()
 
-        for section_data in sections:
-            Section.objects.create(
-                user=auth_user,
-                post=post,
-                **section_data
-            )
+        new_sections = [
+            Section(user=auth_user, post=post, **section_data)
+            for section_data in sections
+        ]
+        SECTION_ORDER_FIELD.assign_many(new_sections)
+        Section.objects.bulk_create(new_sections)
 
 
 class PostListSerializer(PostSerializer):
     """Serializer for retrieving list of posts."""
 
     class Meta(PostSerializer.Meta):
-        fields = ['title', 'slug', 'excerpt', 'image', 'time_read',
-                  'created_at', 'updated_at', 'category', 'author', 'tags']
+        fields = ('title', 'slug', 'excerpt', 'image', 'time_read',
+                  'created_at', 'updated_at', 'category', 'author', 'tags')
+
+    def to_representation(self, instance):
+        """Serialize a post row with plain attribute access."""
+
+        ret = {}
+
+        for field in self._readable_fields:
+            attrs = field.source_attrs
+
+            if len(attrs) == 1:
+                attribute = getattr(instance, attrs[0])
+            else:
+                try:
+                    attribute = field.get_attribute(instance)
+                except serializers.SkipField:
+                    continue
+
+            if attribute is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+
+        return ret
 
 
 class PostImageSerializer(serializers.ModelSerializer):
@@ -226,6 +292,20 @@ class PostImageSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Post
-        fields = ['slug', 'image']
-        read_only_fields = ['slug']
+        fields = ('slug', 'image')
+        read_only_fields = ('slug',)
         extra_kwargs = {'image': {'required': 'True'}}
+
+
+def _warm_serializer_fields():
+    """
+    Populate the CachedFieldsMixin field cache for the nested serializers
+    at import time, so the first request doesn't pay for it.
+    """
+
+    for serializer_class in (TagSerializer, SectionSerializer,
+                             CommentSerializer):
+        serializer_class().fields
+
+
+_warm_serializer_fields()
@@ -1,10 +1,12 @@
 """
 Tests for Author APIs.
 """
+import functools
 
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+from django.utils.text import slugify
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -14,10 +16,15 @@ from post.models import Author
 AUTHORS_URL = reverse('author-list')
 
 
+_DETAIL_URL_PATTERN = reverse('author-detail',
+                              args=['__x__']).replace('__x__', '{}')
+
+
+@functools.lru_cache(maxsize=None)
 def detail_url(author_slug):
     """Create and return the url for a detail page."""
 
-    return reverse('author-detail', args=[author_slug])
+    return _DETAIL_URL_PATTERN.format(author_slug)
 
 
 def create_author(user, **params):
@@ -31,11 +38,16 @@ def create_author(user, **params):
     return Author.objects.create(user=user, **defaults)
 
 
-class PublicAuthorTest(TestCase):
+class PublicAuthorTest(SimpleTestCase):
     """Tests for unauthorized requests."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+
     def setUp(self):
-        self.client = APIClient()
+        self.client = self.api_client
 
     def test_not_authenticated_fails(self):
         """Test access forbidden for not authenticated user."""
@@ -48,19 +60,29 @@ class PublicAuthorTest(TestCase):
 class PrivateAuthorTest(TestCase):
     """Tests for authenticated users requests."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test_author@example.com',
             password='test_pass_123'
         )
-        self.client.force_authenticate(user=self.user)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(user=cls.user)
+
+    def setUp(self):
+        self.client = self.api_client
 
     def test_retrieve_author_list_successful(self):
         """Test retrieving the list of categories successfully."""
 
-        create_author(self.user, name='Author 1')
-        create_author(self.user, name='Author 2')
+        Author.objects.bulk_create([
+            Author(user=self.user, name='Author 1', slug=slugify('Author 1')),
+            Author(user=self.user, name='Author 2', slug=slugify('Author 2')),
+        ])
 
         r = self.client.get(AUTHORS_URL)
 
@@ -79,8 +101,12 @@ class PrivateAuthorTest(TestCase):
         self.assertEqual(r.status_code, status.HTTP_201_CREATED)
         self.assertEqual(r.data['name'], payload['name'])
 
-        category = Author.objects.get(name=payload['name'])
-        self.assertEqual(category.user, self.user)
+        self.assertTrue(
+            Author.objects.filter(
+                name=payload['name'],
+                user=self.user
+            ).exists()
+        )
 
     def test_retrieve_single_author(self):
         """Test retrieving one particular author."""
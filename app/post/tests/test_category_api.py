@@ -1,8 +1,10 @@
 """Tests for Category APIs."""
+import functools
 
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+from django.utils.text import slugify
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -12,10 +14,15 @@ from post.models import Category
 CATEGORIES_URL = reverse('category-list')
 
 
+_DETAIL_URL_PATTERN = reverse('category-detail',
+                              args=['__x__']).replace('__x__', '{}')
+
+
+@functools.lru_cache(maxsize=None)
 def detail_url(category_slug):
     """Create and return the url for a detail page."""
 
-    return reverse('category-detail', args=[category_slug])
+    return _DETAIL_URL_PATTERN.format(category_slug)
 
 
 def create_category(user, **params):
@@ -29,11 +36,16 @@ def create_category(user, **params):
     return Category.objects.create(user=user, **defaults)
 
 
-class PublicCategoryTest(TestCase):
+class PublicCategoryTest(SimpleTestCase):
     """Tests for unauthorized requests."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+
     def setUp(self):
-        self.client = APIClient()
+        self.client = self.api_client
 
     def test_not_authenticated_fails(self):
         """Test access forbidden for not authenticated user."""
@@ -46,19 +58,31 @@ class PublicCategoryTest(TestCase):
 class PrivateCategoryTest(TestCase):
     """Tests for authenticated users requests."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test_category@example.com',
             password='test_pass_123'
         )
-        self.client.force_authenticate(user=self.user)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(user=cls.user)
+
+    def setUp(self):
+        self.client = self.api_client
 
     def test_retrieve_category_list_successful(self):
         """Test retrieving the list of categories successfully."""
 
-        create_category(self.user, name='cat 1')
-        create_category(self.user, name='cat 2')
+        Category.objects.bulk_create([
+            Category(user=self.user, name='cat 1',
+                     slug=slugify('cat 1'), ordering=1),
+            Category(user=self.user, name='cat 2',
+                     slug=slugify('cat 2'), ordering=2),
+        ])
 
         r = self.client.get(CATEGORIES_URL)
 
@@ -78,8 +102,12 @@ class PrivateCategoryTest(TestCase):
         self.assertEqual(r.data['name'], payload['name'])
         self.assertEqual(r.data['ordering'], 1)
 
-        category = Category.objects.get(name=payload['name'])
-        self.assertEqual(category.user, self.user)
+        self.assertTrue(
+            Category.objects.filter(
+                name=payload['name'],
+                user=self.user
+            ).exists()
+        )
 
     def test_create_category_with_custom_slug(self):
         """Test creating a category with custom slug"""
@@ -134,8 +162,10 @@ class PrivateCategoryTest(TestCase):
         self.assertEqual(r.status_code, status.HTTP_200_OK)
 
         category.refresh_from_db()
-        for attr, value in payload.items():
-            self.assertEqual(getattr(category, attr), value)
+        self.assertEqual(
+            {attr: getattr(category, attr) for attr in payload},
+            payload
+        )
 
     def test_delete_category_success(self):
         """Test removing a category successfully."""
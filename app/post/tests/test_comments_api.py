@@ -1,6 +1,7 @@
 """
 Tests for Comments APIs.
 """
+import functools
 
 from django.urls import reverse
 from django.contrib.auth import get_user_model
@@ -14,10 +15,15 @@ from post.models import Post, Comment
 COMMENTS_URL = reverse('comment-list')
 
 
+_DETAIL_URL_PATTERN = reverse('comment-detail',
+                              args=['__x__']).replace('__x__', '{}')
+
+
+@functools.lru_cache(maxsize=None)
 def detail_url(comment_id):
     """Create and return the url for a detail page."""
 
-    return reverse('comment-detail', args=[comment_id])
+    return _DETAIL_URL_PATTERN.format(comment_id)
 
 
 def create_post(user, **params):
@@ -48,23 +54,36 @@ def create_comment(user, post, **params):
 class CommentsTests(TestCase):
     """Tests for unauthorized requests."""
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test_comments@example.com',
             password='test_pass_123'
         )
-        self.client = APIClient()
-        self.client.force_authenticate(self.user)
-        self.post = create_post(self.user)
+        cls.post = create_post(cls.user)
+        cls.post_2 = create_post(cls.user, title='another title', time_read=7)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(cls.user)
+
+    def setUp(self):
+        self.client = self.api_client
 
     def test_retrieve_comments_list_success(self):
         """Test retrieving list of comments successfully."""
 
-        create_comment(self.user, self.post)
-        cmt2 = create_comment(self.user, self.post, name='Jack')
-        self.post.refresh_from_db()
+        _, cmt2 = Comment.objects.bulk_create([
+            Comment(user=self.user, post=self.post, name='John',
+                    message='Some sample message.'),
+            Comment(user=self.user, post=self.post, name='Jack',
+                    message='Some sample message.'),
+        ])
 
-        r = self.client.get(COMMENTS_URL)
+        with self.assertNumQueries(2):
+            r = self.client.get(COMMENTS_URL)
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['results']), 2)
@@ -84,8 +103,7 @@ class CommentsTests(TestCase):
         r = self.client.post(COMMENTS_URL, payload)
 
         self.assertEqual(r.status_code, status.HTTP_201_CREATED)
-        for k, v in payload.items():
-            self.assertEqual(r.data[k], v)
+        self.assertEqual({k: r.data[k] for k in payload}, payload)
 
     def test_retrieve_single_comment(self):
         """Test retrieving a single comment."""
@@ -117,9 +135,8 @@ class CommentsTests(TestCase):
 
         cmt = create_comment(self.user, self.post, name='Anna')
         url = detail_url(cmt.id)
-        post_2 = create_post(self.user, title='another title', time_read=7)
         payload = {
-            'post_slug': post_2.slug,
+            'post_slug': self.post_2.slug,
             'name': 'New Name',
             'message': 'Changed message.'
         }
@@ -128,8 +145,7 @@ class CommentsTests(TestCase):
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         cmt.refresh_from_db()
-        for k, v in payload.items():
-            self.assertEqual(r.data[k], v)
+        self.assertEqual({k: r.data[k] for k in payload}, payload)
 
     def test_delete_comment(self):
         """Test deleting a comment successfully."""
@@ -155,6 +171,26 @@ class CommentsTests(TestCase):
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['results']), 1)
 
+    def test_comment_counts(self):
+        """Test retrieving visible and hidden comment counts."""
+
+        Comment.objects.bulk_create([
+            Comment(user=self.user, post=self.post, name='John',
+                    message='Some sample message.', is_visible=True),
+            Comment(user=self.user, post=self.post, name='Jack',
+                    message='Some sample message.'),
+            Comment(user=self.user, post=self.post_2, name='Anna',
+                    message='Some sample message.'),
+        ])
+
+        params = {'post': self.post.slug}
+
+        with self.assertNumQueries(1):
+            r = self.client.get(reverse('comment-counts'), params)
+
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(r.data, {'visible': 1, 'hidden': 1})
+
     def test_filter_comments_visibility(self):
         """Test filtering comments by is_visible parameter."""
 
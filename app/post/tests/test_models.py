@@ -9,6 +9,15 @@ from django.test import TestCase
 
 from post.models import Category, Author, Post, Section, Tag, Comment
 
+CATEGORY_NAME = 'First Test Category'
+CATEGORY_SLUG = slugify(CATEGORY_NAME)
+
+AUTHOR_NAME = 'Author N. Name'
+AUTHOR_SLUG = slugify(AUTHOR_NAME)
+
+POST_TITLE = 'Sample Post Title'
+POST_SLUG = slugify(POST_TITLE)
+
 
 def create_category(user, **params):
     """Create and return a sample category."""
@@ -37,8 +46,9 @@ def create_post(user, **params):
 class ModelTests(TestCase):
     """Tests for models"""
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test@example.com',
             password='test_pass_123'
         )
@@ -46,13 +56,11 @@ class ModelTests(TestCase):
     def test_category_create(self):
         """Test creating a category object."""
 
-        payload = {'name': 'First Test Category'}
+        category = create_category(self.user, name=CATEGORY_NAME)
 
-        category = create_category(self.user, **payload)
-
-        self.assertTrue(Category.objects.filter(name=payload['name']).exists())
-        self.assertEqual(str(category), payload['name'])
-        self.assertEqual(category.slug, slugify(payload['name']))
+        self.assertTrue(Category.objects.filter(name=CATEGORY_NAME).exists())
+        self.assertEqual(str(category), CATEGORY_NAME)
+        self.assertEqual(category.slug, CATEGORY_SLUG)
         self.assertEqual(category.ordering, 1)
 
     def test_create_category_duplicated_slug_raise_error(self):
@@ -74,30 +82,30 @@ class ModelTests(TestCase):
     def test_create_author_success(self):
         """Test creating an author successfully."""
 
-        payload = {'name': 'Author N. Name'}
-        author = Author.objects.create(user=self.user, **payload)
+        author = Author.objects.create(user=self.user, name=AUTHOR_NAME)
 
-        self.assertTrue(Author.objects.filter(name=payload['name']).exists())
-        self.assertEqual(str(author), payload['name'])
-        self.assertEqual(author.slug, slugify(payload['name']))
+        self.assertTrue(Author.objects.filter(name=AUTHOR_NAME).exists())
+        self.assertEqual(str(author), AUTHOR_NAME)
+        self.assertEqual(author.slug, AUTHOR_SLUG)
 
 
 class PostModelTests(TestCase):
     """Tests for post model."""
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test@example.com',
             password='test_pass_123'
         )
-        self.category = create_category(self.user)
-        self.author = Author.objects.create(user=self.user, name='Author Name')
+        cls.category = create_category(cls.user)
+        cls.author = Author.objects.create(user=cls.user, name='Author Name')
 
     def test_create_post_success(self):
         """Test creating a post successfully."""
 
         payload = {
-            'title': 'Sample Post Title',
+            'title': POST_TITLE,
             'excerpt': 'Sample post excerpt.',
             'category': self.category,
             'author': self.author,
@@ -105,11 +113,10 @@ class PostModelTests(TestCase):
             }
         post = Post.objects.create(user=self.user, **payload)
 
-        self.assertTrue(Post.objects.filter(title=payload['title']).exists())
-        self.assertEqual(str(post), payload['title'])
-        self.assertEqual(post.slug, slugify(payload['title']))
-        for k, v in payload.items():
-            self.assertEqual(getattr(post, k), v)
+        self.assertTrue(Post.objects.filter(title=POST_TITLE).exists())
+        self.assertEqual(str(post), POST_TITLE)
+        self.assertEqual(post.slug, POST_SLUG)
+        self.assertEqual({k: getattr(post, k) for k in payload}, payload)
 
     def test_create_section_success(self):
         """Test creating a section of post."""
@@ -180,5 +187,7 @@ class PostModelTests(TestCase):
 
         post.refresh_from_db()
         self.assertEqual(post.comments.count(), 1)
-        for k, v in payload.items():
-            self.assertEqual(getattr(comment, k), v)
+        self.assertEqual(
+            {k: getattr(comment, k) for k in payload},
+            payload
+        )
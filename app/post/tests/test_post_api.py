@@ -1,12 +1,16 @@
 """
 Tests for Post APIs.
 """
-import tempfile
+import functools
+import io
+import json
 import os
 
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from django.utils.text import slugify
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -17,17 +21,92 @@ from post.models import Post, Author, Category, Section, Tag, Comment
 
 POSTS_URL = reverse('post-list')
 
+_JPEG_BUF = io.BytesIO()
+Image.new('RGB', (10, 10)).save(_JPEG_BUF, 'JPEG')
+_JPEG_BYTES = _JPEG_BUF.getvalue()
+
+
+_UPDATE_SECTIONS_PAYLOAD = {'sections': [
+    {
+        'sub_title': 'Second Text Section',
+        'content': 'Lorem ipsum dolor sit amet, consectetur '
+                   'adipiscing elit, sed do eiusmod tempor '
+                   'incididunt ut labore et dolore magna aliqua. '
+                   'Ut enim ad minim veniam, quis nostrud '
+                   'id est laborum.',
+        'ordering': 2
+    },
+    {
+        'sub_title': 'First Text Section',
+        'content': 'Lorem ipsum dolor sit amet, consectetur '
+                   'adipiscing elit, sed do eiusmod tempor '
+                   'incididunt ut labore et dolore magna aliqua. '
+                   'Ut enim ad minim veniam, quis nostrud '
+                   'id est laborum.',
+        'ordering': 1
+    }
+]}
+_UPDATE_SECTIONS_JSON = json.dumps(_UPDATE_SECTIONS_PAYLOAD).encode()
+
+_CREATE_POST_WITH_TAGS_PAYLOAD = {
+    'title': 'My Awsome Post',
+    'excerpt': 'Cool excerpt of my post.',
+    'time_read': 3,
+    'tags': [
+        {'name': 'tag1'},
+        {'name': 'tag2'}
+    ]
+}
+_CREATE_POST_WITH_TAGS_JSON = json.dumps(_CREATE_POST_WITH_TAGS_PAYLOAD).encode()
+
+_UPDATE_POST_TAGS_PAYLOAD = {
+    'tags': [
+        {'name': 'tag1'},
+        {'name': 'tag2'}
+    ]
+}
+_UPDATE_POST_TAGS_JSON = json.dumps(_UPDATE_POST_TAGS_PAYLOAD).encode()
+
+
+_DETAIL_URL_PATTERN = reverse('post-detail',
+                              args=['__x__']).replace('__x__', '{}')
+
+_UPLOAD_IMAGE_URL_PATTERN = reverse('post-upload-image',
+                                    args=['__x__']).replace('__x__', '{}')
+
+_UPDATE_SECTION_URL_PATTERN = reverse(
+    'post-update-section', args=['__x__', 987654321]
+).replace('__x__', '{}').replace('987654321', '{}')
+
+_DELETE_SECTION_URL_PATTERN = reverse(
+    'post-delete-section', args=['__x__', 987654321]
+).replace('__x__', '{}').replace('987654321', '{}')
+
 
+@functools.lru_cache(maxsize=None)
 def detail_url(post_slug):
     """Create and return the url for a detail page."""
 
-    return reverse('post-detail', args=[post_slug])
+    return _DETAIL_URL_PATTERN.format(post_slug)
 
 
+@functools.lru_cache(maxsize=None)
 def upload_image_url(post_slug):
     """Create and return the url for an uploading an image."""
 
-    return reverse('post-upload-image', args=[post_slug])
+    return _UPLOAD_IMAGE_URL_PATTERN.format(post_slug)
+
+
+def update_section_url(post_slug, ordering):
+    """Create and return the url for updating a post section."""
+
+    return _UPDATE_SECTION_URL_PATTERN.format(post_slug, ordering)
+
+
+def delete_section_url(post_slug, ordering):
+    """Create and return the url for deleting a post section."""
+
+    return _DELETE_SECTION_URL_PATTERN.format(post_slug, ordering)
 
 
 def create_post(user, **params):
@@ -43,11 +122,32 @@ def create_post(user, **params):
     return Post.objects.create(user=user, **defaults)
 
 
-class PublicPostTest(TestCase):
+def bulk_create_posts(user, specs):
+    """Insert sample posts with a single bulk INSERT."""
+
+    posts = []
+    for spec in specs:
+        params = {
+            'title': 'Sample Post Title',
+            'excerpt': 'Sample post excerpt.',
+            'time_read': 5,
+            **spec
+        }
+        posts.append(Post(user=user, **params))
+
+    return Post.prepare_bulk(posts)
+
+
+class PublicPostTest(SimpleTestCase):
     """Tests for unauthorized requests."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+
     def setUp(self):
-        self.client = APIClient()
+        self.client = self.api_client
 
     def test_not_authenticated_fails(self):
         """Test access forbidden for not authenticated user."""
@@ -60,26 +160,48 @@ class PublicPostTest(TestCase):
 class PrivatePostTest(TestCase):
     """Tests for authenticated users requests."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test_post@example.com',
             password='test_pass_123'
         )
-        self.client.force_authenticate(user=self.user)
-        self.author = Author.objects.create(user=self.user, name='John Dow')
-        self.category = Category.objects.create(
-            user=self.user,
-            name='Sample Category'
-        )
+        cls.author, cls.author_2 = Author.objects.bulk_create([
+            Author(user=cls.user, name='John Dow',
+                   slug=slugify('John Dow')),
+            Author(user=cls.user, name='Sarah Falcon',
+                   slug=slugify('Sarah Falcon')),
+        ])
+        cls.category, cls.category_2 = Category.objects.bulk_create([
+            Category(user=cls.user, name='Sample Category',
+                     slug=slugify('Sample Category'), ordering=1),
+            Category(user=cls.user, name='Category 2',
+                     slug=slugify('Category 2'), ordering=2),
+        ])
+        cls.tag_1, cls.tag_2 = Tag.objects.bulk_create([
+            Tag(user=cls.user, name='Tag1'),
+            Tag(user=cls.user, name='Tag2'),
+        ])
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(user=cls.user)
+
+    def setUp(self):
+        self.client = self.api_client
 
     def test_retrieve_post_list_successful(self):
         """Test retrieving the list of posts successfully."""
 
-        create_post(self.user, title='First Post')
-        create_post(self.user, title='Second Post')
+        bulk_create_posts(self.user, [
+            {'title': 'First Post'},
+            {'title': 'Second Post'},
+        ])
 
-        r = self.client.get(POSTS_URL)
+        with self.assertNumQueries(3):
+            r = self.client.get(POSTS_URL)
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['results']), 2)
@@ -97,8 +219,12 @@ class PrivatePostTest(TestCase):
 
         self.assertEqual(r.status_code, status.HTTP_201_CREATED)
 
-        post = Post.objects.get(title=payload['title'])
-        self.assertEqual(post.user, self.user)
+        self.assertTrue(
+            Post.objects.filter(
+                title=payload['title'],
+                user=self.user
+            ).exists()
+        )
 
         for attr in payload:
             self.assertEqual(r.data[attr], payload[attr])
@@ -280,47 +406,37 @@ class PrivatePostTest(TestCase):
                     'id est laborum.'
         )
 
+        url = detail_url(post.slug)
+        r = self.client.patch(url, _UPDATE_SECTIONS_JSON,
+                              content_type='application/json')
+
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(r.data['sections']), 2)
+
+    def test_update_post_sections_mixed_ordering(self):
+        """Test sections mixing explicit and omitted ordering numbers."""
+
+        post = create_post(self.user)
         payload = {'sections': [
-            {
-                'sub_title': 'Second Text Section',
-                'content': 'Lorem ipsum dolor sit amet, consectetur '
-                           'adipiscing elit, sed do eiusmod tempor '
-                           'incididunt ut labore et dolore magna aliqua. '
-                           'Ut enim ad minim veniam, quis nostrud '
-                           'id est laborum.',
-                'ordering': 2
-            },
-            {
-                'sub_title': 'First Text Section',
-                'content': 'Lorem ipsum dolor sit amet, consectetur '
-                           'adipiscing elit, sed do eiusmod tempor '
-                           'incididunt ut labore et dolore magna aliqua. '
-                           'Ut enim ad minim veniam, quis nostrud '
-                           'id est laborum.',
-                'ordering': 1
-            }
+            {'sub_title': 'First', 'content': 'Content 1.', 'ordering': 1},
+            {'sub_title': 'Second', 'content': 'Content 2.'},
         ]}
 
         url = detail_url(post.slug)
-        r = self.client.patch(url, payload, format='json')
+        r = self.client.patch(url, json.dumps(payload).encode(),
+                              content_type='application/json')
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(r.data['sections']), 2)
+        orderings = [s['ordering'] for s in r.data['sections']]
+        self.assertEqual(orderings, [1, 2])
 
     def test_create_post_with_tags(self):
         """Test creating a post with tags."""
 
-        payload = {
-            'title': 'My Awsome Post',
-            'excerpt': 'Cool excerpt of my post.',
-            'time_read': 3,
-            'tags': [
-                {'name': 'tag1'},
-                {'name': 'tag2'}
-            ]
-        }
+        payload = _CREATE_POST_WITH_TAGS_PAYLOAD
 
-        r = self.client.post(POSTS_URL, payload, format='json')
+        r = self.client.post(POSTS_URL, _CREATE_POST_WITH_TAGS_JSON,
+                             content_type='application/json')
 
         self.assertEqual(r.status_code, status.HTTP_201_CREATED)
         post = Post.objects.get(title=payload['title'])
@@ -333,15 +449,10 @@ class PrivatePostTest(TestCase):
         tag = Tag.objects.create(user=self.user, name='OldTag')
         post.tags.add(tag)
 
-        payload = {
-            'tags': [
-                {'name': 'tag1'},
-                {'name': 'tag2'}
-            ]
-        }
         url = detail_url(post.slug)
 
-        r = self.client.patch(url, payload, format='json')
+        r = self.client.patch(url, _UPDATE_POST_TAGS_JSON,
+                              content_type='application/json')
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['tags']), 2)
@@ -359,8 +470,7 @@ class PrivatePostTest(TestCase):
             content='Some content.'
         )
         payload = {'sub_title': 'New Subtitle'}
-        url = reverse('post-update-section',
-                      args=[post.slug, section.ordering])
+        url = update_section_url(post.slug, section.ordering)
 
         r = self.client.patch(url, payload)
 
@@ -378,8 +488,7 @@ class PrivatePostTest(TestCase):
             sub_title='Some Subtitle',
             content='Some content.'
         )
-        url = reverse('post-delete-section',
-                      args=[post.slug, section.ordering])
+        url = delete_section_url(post.slug, section.ordering)
 
         r = self.client.delete(url)
 
@@ -395,14 +504,18 @@ class PrivatePostTest(TestCase):
             'author': self.author
         }
         post = create_post(self.user, **payload)
-        Comment.objects.create(user=self.user, post=post,
-                               message='some msg', is_visible=True)
-        Comment.objects.create(user=self.user, post=post,
-                               message='another msg', is_visible=True)
+        Comment.objects.bulk_create([
+            Comment(user=self.user, post=post,
+                    message='some msg', is_visible=True),
+            Comment(user=self.user, post=post,
+                    message='another msg', is_visible=True),
+        ])
         post.refresh_from_db()
 
         url = detail_url(post.slug)
-        r = self.client.get(url)
+
+        with self.assertNumQueries(4):
+            r = self.client.get(url)
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['comments']), 2)
@@ -411,10 +524,11 @@ class PrivatePostTest(TestCase):
         """Test retrieving only the comments that are visible in post."""
 
         post = create_post(self.user)
-        Comment.objects.create(user=self.user, post=post,
-                               message='some msg')
-        Comment.objects.create(user=self.user, post=post,
-                               message='another msg', is_visible=True)
+        Comment.objects.bulk_create([
+            Comment(user=self.user, post=post, message='some msg'),
+            Comment(user=self.user, post=post,
+                    message='another msg', is_visible=True),
+        ])
 
         url = detail_url(post.slug)
         r = self.client.get(url)
@@ -425,14 +539,15 @@ class PrivatePostTest(TestCase):
     def test_filter_posts_by_author(self):
         """Test filtering posts by author."""
 
-        author2 = Author.objects.create(user=self.user, name='Sarah Falcon')
+        _, post2 = bulk_create_posts(self.user, [
+            {'author': self.author},
+            {'title': 'another post', 'author': self.author_2},
+        ])
 
-        create_post(self.user, author=self.author)
-        post2 = create_post(self.user, title='another post', author=author2)
+        params = {"author": self.author_2.slug}
 
-        params = {"author": author2.slug}
-
-        r = self.client.get(POSTS_URL, params)
+        with self.assertNumQueries(3):
+            r = self.client.get(POSTS_URL, params)
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['results']), 1)
@@ -441,14 +556,15 @@ class PrivatePostTest(TestCase):
     def test_filter_posts_by_category(self):
         """Test filtering posts by category."""
 
-        category = Category.objects.create(user=self.user, name='Category 2')
+        post, _ = bulk_create_posts(self.user, [
+            {'category': self.category_2},
+            {'title': 'another post', 'category': self.category},
+        ])
 
-        post = create_post(self.user, category=category)
-        create_post(self.user, title='another post', category=self.category)
+        params = {"category": self.category_2.slug}
 
-        params = {"category": category.slug}
-
-        r = self.client.get(POSTS_URL, params)
+        with self.assertNumQueries(3):
+            r = self.client.get(POSTS_URL, params)
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['results']), 1)
@@ -457,17 +573,18 @@ class PrivatePostTest(TestCase):
     def test_filter_posts_by_tags(self):
         """Test filtering posts by tags."""
 
-        tag1 = Tag.objects.create(user=self.user, name='Tag1')
-        tag2 = Tag.objects.create(user=self.user, name='Tag2')
-        post1 = create_post(self.user, title='post 1')
-        post1.tags.add(tag1)
-        post2 = create_post(self.user, title='post 2')
-        post2.tags.add(tag2)
-        create_post(self.user)
+        post1, post2, _ = bulk_create_posts(self.user, [
+            {'title': 'post 1'},
+            {'title': 'post 2'},
+            {},
+        ])
+        post1.tags.add(self.tag_1)
+        post2.tags.add(self.tag_2)
 
-        params = {"tags": f'{tag1.id},{tag2.id}'}
+        params = {"tags": f'{self.tag_1.id},{self.tag_2.id}'}
 
-        r = self.client.get(POSTS_URL, params)
+        with self.assertNumQueries(3):
+            r = self.client.get(POSTS_URL, params)
 
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertEqual(len(r.data['results']), 2)
@@ -475,8 +592,10 @@ class PrivatePostTest(TestCase):
     def test_filter_posts_search(self):
         """Test filtering posts by search parameter."""
 
-        post = create_post(self.user, title='Particular Post')
-        create_post(self.user)
+        post, _ = bulk_create_posts(self.user, [
+            {'title': 'Particular Post'},
+            {},
+        ])
 
         params = {"search": "particular"}
 
@@ -489,8 +608,10 @@ class PrivatePostTest(TestCase):
     def test_posts_pagination(self):
         """Test paginating the list of posts."""
 
-        for i in range(1, 22):
-            create_post(self.user, title=f'Title {i}',)
+        bulk_create_posts(
+            self.user,
+            [{'title': f'Title {i}'} for i in range(1, 22)]
+        )
 
         url_page2 = POSTS_URL + '?page=2'
 
@@ -504,13 +625,21 @@ class PrivatePostTest(TestCase):
 class UploadImageTests(TestCase):
     """Tests for uploading image."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test_image@example.com',
             password='test_pass_123'
         )
-        self.client.force_authenticate(user=self.user)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(user=cls.user)
+
+    def setUp(self):
+        self.client = self.api_client
         self.post = create_post(self.user)
 
     def tearDown(self):
@@ -521,13 +650,11 @@ class UploadImageTests(TestCase):
 
         url = upload_image_url(self.post.slug)
 
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as image_file:
-            img = Image.new('RGB', (10, 10))
-            img.save(image_file, 'JPEG')
-            image_file.seek(0)
-            payload = {'image': image_file}
+        image_file = SimpleUploadedFile('test.jpg', _JPEG_BYTES,
+                                        content_type='image/jpeg')
+        payload = {'image': image_file}
 
-            r = self.client.post(url, payload, format='multipart')
+        r = self.client.post(url, payload, format='multipart')
 
         self.post.refresh_from_db()
 
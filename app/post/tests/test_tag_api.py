@@ -4,7 +4,7 @@ Tests for Tag APIs.
 
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -42,11 +42,16 @@ def create_tag(user, **params):
     return Tag.objects.create(user=user, **defaults)
 
 
-class PublicTagTest(TestCase):
+class PublicTagTest(SimpleTestCase):
     """Tests for unauthorized requests."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+
     def setUp(self):
-        self.client = APIClient()
+        self.client = self.api_client
 
     def test_not_authenticated_fails(self):
         """Test access forbidden for not authenticated user."""
@@ -59,13 +64,21 @@ class PublicTagTest(TestCase):
 class PrivateTagTests(TestCase):
     """Tests for authenticated users requests."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email='test_tags@example.com',
             password='test_pass_123'
         )
-        self.client.force_authenticate(user=self.user)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_client = APIClient()
+        cls.api_client.force_authenticate(user=cls.user)
+
+    def setUp(self):
+        self.client = self.api_client
 
     def test_retrieve_tag_list_successful(self):
         """Test retrieving the list of posts successfully."""
@@ -4,12 +4,12 @@ URL mappings for Category, Author, Post APIs.
 
 from django.urls import path, include
 
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from post.views import (CategoryViewSet, AuthorViewSet, PostViewSet,
                         TagViewSet, CommentViewSet)
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register('categories', CategoryViewSet, basename='category')
 router.register('authors', AuthorViewSet, basename='author')
 router.register('posts', PostViewSet, basename='post')
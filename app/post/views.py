@@ -1,8 +1,10 @@
 """
 Views for Category, Author, Post APIs.
 """
+import re
 
-from django.db.models import Prefetch
+from django.db.models import Count, Prefetch
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.db.models import Q
 
@@ -14,7 +16,9 @@ from rest_framework.authentication import TokenAuthentication
 
 from core.permissions import AccessOwnerOnly
 
-from post.models import Category, Author, Post, Tag, Section, Comment
+from post.models import (Category, Author, Post, Tag, Section, Comment,
+                         VISIBLE_COMMENTS_LIMIT)
+from post.cache import get_post_pk_by_slug
 from post.serializers import (
     CategorySerializer,
     AuthorSerializer,
@@ -34,6 +38,8 @@ from drf_spectacular.utils import (
     OpenApiTypes
 )
 
+_TAG_IDS_RE = re.compile(r'^\d+(?:,\d+)*$')
+
 
 class BaseViewSet(viewsets.ModelViewSet):
     """Base view set for APIs."""
@@ -41,16 +47,23 @@ class BaseViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, AccessOwnerOnly]
     authentication_classes = [TokenAuthentication]
     lookup_field = 'slug'
+    _user = None
+
+    def initial(self, request, *args, **kwargs):
+        """Resolve the authenticated user once per request."""
+
+        super().initial(request, *args, **kwargs)
+        self._user = request.user
 
     def get_queryset(self):
         """Filter the queryset by user."""
 
-        return self.queryset.filter(user=self.request.user)
+        return self.queryset.filter(user=self._user)
 
     def perform_create(self, serializer):
         """Assign the new category to the authenticated user."""
 
-        serializer.save(user=self.request.user)
+        serializer.save(user=self._user)
 
 
 class CategoryViewSet(BaseViewSet):
@@ -65,14 +78,23 @@ class AuthorViewSet(BaseViewSet):
 
     queryset = Author.objects.all().order_by('name')
     serializer_class = AuthorDetailSerializer
+    action_serializers = {'list': AuthorSerializer}
 
     def get_serializer_class(self):
         """Return the serializer for a particular action."""
 
+        return self.action_serializers.get(self.action,
+                                           self.serializer_class)
+
+    def get_queryset(self):
+        """Filter the queryset and trim it for the list action."""
+
+        queryset = super().get_queryset()
+
         if self.action == 'list':
-            return AuthorSerializer
+            queryset = queryset.only('id', 'name', 'slug')
 
-        return self.serializer_class
+        return queryset
 
 
 @extend_schema_view(
@@ -131,56 +153,86 @@ class AuthorViewSet(BaseViewSet):
 class PostViewSet(BaseViewSet):
     """View for Post APIs."""
 
-    queryset = Post.objects.all().select_related(
-        'category',
-        'author'
-    ).prefetch_related(Prefetch('sections'))
+    queryset = Post.objects.all().select_related('category', 'author')
 
     serializer_class = PostSerializer
+    action_serializers = {
+        'list': PostListSerializer,
+        'upload_image': PostImageSerializer,
+        'update_section': SectionSerializer,
+    }
 
     def get_serializer_class(self):
         """Return the proper serializer class for a particular request."""
 
-        if self.action == 'list':
-            return PostListSerializer
-        if self.action == 'upload_image':
-            return PostImageSerializer
-        if self.action == 'update_section':
-            return SectionSerializer
-
-        return self.serializer_class
+        return self.action_serializers.get(self.action,
+                                           self.serializer_class)
 
     def get_queryset(self):
         """Filter and return the queryset."""
 
         queryset = super().get_queryset()
 
-        autor_slug = self.request.query_params.get('author', None)
-        category_slug = self.request.query_params.get('category', None)
-        tag_ids = self.request.query_params.get('tags', None)
-        search = self.request.query_params.get('search', None)
+        if self.action == 'list':
+            queryset = queryset.only(
+                'title', 'slug', 'excerpt', 'image', 'time_read',
+                'created_at', 'updated_at',
+                'category__name', 'category__slug', 'category__ordering',
+                'author__name', 'author__slug'
+            ).prefetch_related('tags')
+        else:
+            queryset = queryset.prefetch_related(
+                'tags',
+                Prefetch(
+                    'sections',
+                    queryset=Section.objects.order_by('ordering', 'pk')
+                ),
+                Prefetch(
+                    'comments',
+                    queryset=Comment.objects.filter(
+                        user=self._user,
+                        is_visible=True
+                    ).order_by('id')[:VISIBLE_COMMENTS_LIMIT],
+                    to_attr='visible_comments'
+                )
+            )
 
-        if search is not None:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(excerpt__icontains=search) |
-                Q(sections__sub_title__icontains=search) |
-                Q(sections__content__icontains=search)
-            ).distinct()
+        params = self.request.query_params
+        autor_slug = params.get('author', None)
+        category_slug = params.get('category', None)
+        tag_ids = params.get('tags', None)
+        search = params.get('search', None)
+
+        filters = {}
 
         if tag_ids is not None:
-            try:
-                ids = list(map(int, tag_ids.split(',')))
-            except ValueError:
-                ids = list()
+            if _TAG_IDS_RE.match(tag_ids):
+                ids = set(map(int, tag_ids.split(',')))
+            else:
+                ids = set()
 
-            queryset = queryset.filter(tags__id__in=ids).distinct()
+            filters['pk__in'] = Post.tags.through.objects.filter(
+                tag_id__in=ids
+            ).values('post_id')
 
         if autor_slug is not None:
-            queryset = queryset.filter(author__slug=autor_slug)
+            filters['author__slug'] = autor_slug
 
         if category_slug is not None:
-            queryset = queryset.filter(category__slug=category_slug)
+            filters['category__slug'] = category_slug
+
+        if search is not None:
+            queryset = queryset.filter(
+                Q(title__icontains=search) |
+                Q(excerpt__icontains=search) |
+                Q(pk__in=Section.objects.filter(
+                    Q(sub_title__icontains=search) |
+                    Q(content__icontains=search)
+                ).values('post_id')),
+                **filters
+            )
+        elif filters:
+            queryset = queryset.filter(**filters)
 
         return queryset.order_by('created_at')
 
@@ -203,13 +255,26 @@ class PostViewSet(BaseViewSet):
     def update_section(self, request, slug=None, sect_ord=None):
         """Update a single section of a particular post."""
 
-        post = get_object_or_404(Post, slug=slug)
-        section = get_object_or_404(Section, post=post, ordering=sect_ord)
+        serializer = SectionSerializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        fields = serializer.validated_data
+
+        if fields:
+            updated = Section.objects.filter(
+                post__user=self._user,
+                post__slug=slug,
+                ordering=sect_ord
+            ).update(**fields)
 
-        for key, value in request.data.items():
-            setattr(section, key, value)
+            if not updated:
+                raise Http404
 
-        section.save()
+        section = get_object_or_404(
+            Section,
+            post__user=self._user,
+            post__slug=slug,
+            ordering=fields.get('ordering', sect_ord)
+        )
 
         return Response(SectionSerializer(section).data, status=status.HTTP_200_OK)
 
@@ -219,10 +284,14 @@ class PostViewSet(BaseViewSet):
     def delete_section(self, request, slug=None, sect_ord=None):
         """Remove a single section of a particular post."""
 
-        post = get_object_or_404(Post, slug=slug)
-        section = get_object_or_404(Section, post=post, ordering=sect_ord)
+        deleted, _ = Section.objects.filter(
+            post__user=self._user,
+            post__slug=slug,
+            ordering=sect_ord
+        ).delete()
 
-        section.delete()
+        if not deleted:
+            raise Http404
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -234,6 +303,16 @@ class TagViewSet(BaseViewSet):
     serializer_class = TagSerializer
     lookup_field = 'id'
 
+    def get_queryset(self):
+        """Filter the queryset and trim it for the list action."""
+
+        queryset = super().get_queryset()
+
+        if self.action == 'list':
+            queryset = queryset.only('id', 'name')
+
+        return queryset
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -269,7 +348,7 @@ class TagViewSet(BaseViewSet):
 class CommentViewSet(BaseViewSet):
     """View for Comment APIs."""
 
-    queryset = Comment.objects.all()
+    queryset = Comment.objects.all().select_related('post')
     serializer_class = CommentSerializer
     lookup_field = 'id'
 
@@ -278,16 +357,36 @@ class CommentViewSet(BaseViewSet):
 
         qs = super().get_queryset()
 
-        post_slug = self.request.query_params.get('post', None)
-        visible = self.request.query_params.get('visible', None)
+        params = self.request.query_params
+        post_slug = params.get('post', None)
+        visible = params.get('visible', None)
+
+        filters = {}
 
         if post_slug:
-            post = get_object_or_404(Post, slug=post_slug)
-            qs = qs.filter(post=post)
+            filters['post_id'] = get_post_pk_by_slug(post_slug)
 
         if visible == 'false':
-            qs = qs.filter(is_visible=False)
+            filters['is_visible'] = False
         elif visible == 'true':
-            qs = qs.filter(is_visible=True)
+            filters['is_visible'] = True
+
+        if filters:
+            qs = qs.filter(**filters)
 
         return qs.order_by('id')
+
+    @action(methods=['GET'], detail=False)
+    def counts(self, request):
+        """Return visible and hidden comment counts in one query."""
+
+        qs = Comment.objects.filter(user=self._user)
+
+        post_slug = request.query_params.get('post', None)
+        if post_slug:
+            qs = qs.filter(post__slug=post_slug)
+
+        return Response(qs.aggregate(
+            visible=Count('id', filter=Q(is_visible=True)),
+            hidden=Count('id', filter=Q(is_visible=False)),
+        ))
@@ -10,6 +10,7 @@ class UserAdmin(BaseUserAdmin):
     ordering = ['id']
     list_display = ['email', 'name']
     list_filter = ['is_staff', 'is_active']
+    search_fields = ['email', 'name']
 
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
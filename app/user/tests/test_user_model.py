@@ -20,6 +20,18 @@ class UserModeTests(TestCase):
         )
 
         self.assertEquals(user.email, email)
+        self.assertTrue(user.has_usable_password())
+
+    def test_password_can_be_verified(self):
+        """Test the stored password verifies against the raw one."""
+
+        password = 'test_pass123'
+
+        user = get_user_model().objects.create_user(
+            email='test@example.com',
+            password=password
+        )
+
         self.assertTrue(user.check_password(password))
 
     def test_new_user_email_normalized(self):